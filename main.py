@@ -2,44 +2,261 @@
 
 import csv
 import json
-import time
 import re
+import time
+import base64
+import os
+import sys
+import hashlib
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 import logging
 from urllib.parse import urljoin
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+_NON_DIGIT = re.compile(r'\D')
+_SLUG_CHARS = re.compile(r'[^a-z0-9]+')
+_PRICE_CTX = re.compile(r'₹\s*[\d,]+(?:\s*[^<\n]*(?:car\s*cover|seat\s*cover|body\s*cover)[^<\n]*)?', re.IGNORECASE)
+_TITLE_CTX = re.compile(r'(?:car\s*cover|seat\s*cover|body\s*cover|wheel\s*cover)[^<>]*', re.IGNORECASE)
+
+# Keywords that mark a car cover listing, and property keywords that rule one out.
+# Exclusions (and their plurals) must not sit inside a longer word, so "salespitch"
+# or "current" pass while "flats", "2bhk" and "1200sqft" are still excluded.
+_INCLUDE_RE = re.compile(r'car cover|body cover|seat cover|wheel cover|brake cover|car mat', re.IGNORECASE)
+_EXCLUDE_RE = re.compile(r'(?<![a-z])(?:bhk|flats?|apartments?|parking|rent(?:al)?|sales?|sqft|bathrooms?|bedrooms?)\b', re.IGNORECASE)
+
+_CSV_FIELDS = ('title', 'price', 'location', 'date', 'url')
+
+# Installs a MutationObserver on the listings container, or <body> when OLX
+# doesn't render one (again if the page replaced it), then scrolls. Returns the
+# listing count before scrolling; unrelated mutations such as ads or spinners are
+# filtered out by comparing against that count.
+_SCROLL_AND_WATCH_JS = """
+const listingSelector = arguments[0];
+const container = document.querySelector("[data-aut-id='itemsContainer']") || document.body;
+if (window.__observedContainer !== container) {
+    new MutationObserver(() => { window.__newContent = true; })
+        .observe(container, {childList: true, subtree: true});
+    window.__observedContainer = container;
+}
+window.__newContent = false;
+const count = document.querySelectorAll(listingSelector).length;
+window.scrollTo(0, document.body.scrollHeight);
+return count;
+"""
+
+# True once the container has mutated and more listings exist than before the scroll
+_TAKE_NEW_CONTENT_JS = """
+const [listingSelector, before] = arguments;
+if (!window.__newContent) return false;
+window.__newContent = false;
+return document.querySelectorAll(listingSelector).length > before;
+"""
+
+# Elements that mark a rendered listing, most specific first
+_LISTING_SELECTORS = [
+    "[data-aut-id='itemBox']",
+    ".EIR5N",
+    "[data-aut-id='itemTitle']",
+    ".rui-38N2G",
+    ".rui-1ykdW",
+    "li[data-aut-id='itemBox']"
+]
+_ANY_LISTING_SELECTOR = ", ".join(_LISTING_SELECTORS)
+
+# Listings API requests made by the page, and how long to wait for one
+_API_URL_RE = re.compile(r'/api/relevance/v\d+/search')
+_API_CAPTURE_TIMEOUT = 5
+
+# Where the resolved chromedriver path is remembered, and for how long (seconds),
+# so webdriver-manager's version check only runs about once a week
+_DRIVER_PATH_CACHE = Path.home() / ".cache" / "olx_scraper_driver_path"
+_DRIVER_PATH_MAX_AGE = 7 * 24 * 60 * 60
+
+# Extra loads of listings to fetch after the first page, by scrolling or by API page
+_MAX_SCROLLS = 3
+
+# Threads used for per-element extraction when the batch script is unavailable
+_EXTRACT_WORKERS = 8
+
+# Images and fonts, with or without a query string, plus OLX's image CDN whose
+# URLs (".../image;s=300x600") carry no extension. Stylesheets are left alone
+# since infinite scroll depends on the page layout.
+_BLOCKED_EXTENSIONS = ("jpg", "jpeg", "png", "gif", "webp", "svg", "woff", "woff2", "ttf")
+_BLOCKED_URL_PATTERNS = (
+    [f"*.{ext}" for ext in _BLOCKED_EXTENSIONS]
+    + [f"*.{ext}?*" for ext in _BLOCKED_EXTENSIONS]
+    + ["*://apollo.olx.in/*", "*://*.apollo.olx.in/*", "*/image;s=*"]
+)
+
+_FIELD_SELECTORS = {
+    'title': [
+        "[data-aut-id='itemTitle']",
+        "h2", "h3",
+        ".rui-35953",
+        "a[href*='/item/']"
+    ],
+    'price': [
+        "[data-aut-id='itemPrice']",
+        ".rui-ANJaG",
+        "span[class*='price']",
+        "span[class*='amount']"
+    ],
+    'location': [
+        "[data-aut-id='item-location']",
+        ".rui-1Wks1",
+        "span[class*='location']",
+        "span[class*='place']"
+    ],
+    'date': [
+        "[data-aut-id='item-date']",
+        "span[class*='date']",
+        "span[class*='time']"
+    ]
+}
+
+# Fields whose values repeat across listings and are worth interning
+_INTERNED_FIELDS = frozenset(('location', 'date'))
+
+# Optional XPath union per field covering every entry in _FIELD_SELECTORS, so a
+# field that is missing altogether costs a single round-trip. Fields without an
+# entry here skip the probe and go straight to the CSS selector list.
+_FIELD_XPATHS = {
+    'title': (
+        ".//*[@data-aut-id='itemTitle'] | .//h2 | .//h3"
+        " | .//*[contains(concat(' ', normalize-space(@class), ' '), ' rui-35953 ')]"
+        " | .//a[contains(@href, '/item/')]"
+    ),
+    'price': (
+        ".//*[@data-aut-id='itemPrice']"
+        " | .//*[contains(concat(' ', normalize-space(@class), ' '), ' rui-ANJaG ')]"
+        " | .//span[contains(@class, 'price')] | .//span[contains(@class, 'amount')]"
+    ),
+    'location': (
+        ".//*[@data-aut-id='item-location']"
+        " | .//*[contains(concat(' ', normalize-space(@class), ' '), ' rui-1Wks1 ')]"
+        " | .//span[contains(@class, 'location')] | .//span[contains(@class, 'place')]"
+    ),
+    'date': (
+        ".//*[@data-aut-id='item-date']"
+        " | .//span[contains(@class, 'date')] | .//span[contains(@class, 'time')]"
+    )
+}
+
+# Walks every listing inside the page and returns the first non-empty text for
+# each field, so the whole page costs one WebDriver round-trip
+_EXTRACT_LISTINGS_JS = """
+const [listingSelector, fieldSelectors] = arguments;
+const firstText = (el, selectors) => {
+    for (const selector of selectors) {
+        const found = el.querySelector(selector);
+        // innerText is undefined on SVG and other non-HTML elements
+        const text = found ? (found.innerText || found.textContent || '').trim() : '';
+        if (text) return text;
+    }
+    return '';
+};
+return Array.from(document.querySelectorAll(listingSelector)).map(el => {
+    const link = el.querySelector("a[href*='/item/']");
+    const data = {url: link ? link.href : ''};
+    for (const [field, selectors] of Object.entries(fieldSelectors)) {
+        data[field] = firstText(el, selectors);
+    }
+    return data;
+});
+"""
+
+@lru_cache(maxsize=1024)
+def _parse_price(price_text):
+    """Digits of a price string, cached since the same prices recur across listings"""
+    return _NON_DIGIT.sub('', price_text) or None
+
 class OLXCarCoverScraper:
-    def __init__(self):
+    def __init__(self, use_selenium_fallback=True, use_cache=True, debugger_address=None, chromedriver_path=None):
         self.base_url = "https://www.olx.in"
         self.search_url = "https://www.olx.in/items/q-car-cover"
+        self.api_url = "https://www.olx.in/api/relevance/v4/search"
+        self.search_query = "car cover"
+        self.user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+        self.use_selenium_fallback = use_selenium_fallback
+        self.use_cache = use_cache
+        self.cache_path = Path(".olx_cache")
+        self.debugger_address = debugger_address
+        self.chromedriver_path = chromedriver_path
         self.driver = None
+        self._field_selectors = {}
+        
+        # One keep-alive session so repeat requests to olx.in skip the TLS handshake
+        self.http = requests.Session()
+        self.http.headers.update({'User-Agent': self.user_agent})
+        self.http.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+        
+    def close(self):
+        """Release the shared HTTP session"""
+        self.http.close()
         
     def setup_driver(self):
         """Setup Chrome WebDriver with appropriate options"""
         try:
             chrome_options = Options()
-            chrome_options.add_argument("--headless")  
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--window-size=1920,1080")
-            chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-            
-            
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            # Performance logs carry the Network events used to capture the listings API response
+            chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+            # Only the DOM text is needed, so don't wait on subresources
+            chrome_options.page_load_strategy = 'eager'
+            
+            if self.debugger_address:
+                # Attach to a Chrome started with --remote-debugging-port; launch flags don't apply
+                chrome_options.add_experimental_option("debuggerAddress", self.debugger_address)
+            else:
+                chrome_options.add_argument("--headless")  
+                chrome_options.add_argument("--no-sandbox")
+                chrome_options.add_argument("--disable-dev-shm-usage")
+                chrome_options.add_argument("--disable-gpu")
+                chrome_options.add_argument("--window-size=1920,1080")
+                chrome_options.add_argument(f"--user-agent={self.user_agent}")
+                chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+                chrome_options.add_argument("--disable-extensions")
+                chrome_options.add_argument("--disable-background-networking")
+                chrome_options.add_experimental_option("prefs", {
+                    "profile.managed_default_content_settings.images": 2,
+                    "profile.default_content_setting_values.notifications": 2
+                })
+            
+            driver_path = self.chromedriver_path or self.cached_chromedriver_path()
+            try:
+                service = Service(driver_path or self.install_chromedriver())
+                self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            except WebDriverException as e:
+                # A cached driver goes stale once Chrome updates itself; resolve a fresh one once
+                if not driver_path or self.chromedriver_path:
+                    raise
+                logger.warning(f"Cached chromedriver {driver_path} could not start a session, reinstalling: {e}")
+                _DRIVER_PATH_CACHE.unlink(missing_ok=True)
+                service = Service(self.install_chromedriver())
+                self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            self.block_resources()
             logger.info("Chrome WebDriver setup successful")
             return True
             
@@ -47,34 +264,271 @@ class OLXCarCoverScraper:
             logger.error(f"Error setting up WebDriver: {e}")
             return False
     
+    def cached_chromedriver_path(self):
+        """Return the chromedriver path resolved by a recent run, or None"""
+        try:
+            if _DRIVER_PATH_CACHE.exists() and time.time() - _DRIVER_PATH_CACHE.stat().st_mtime < _DRIVER_PATH_MAX_AGE:
+                driver_path = _DRIVER_PATH_CACHE.read_text(encoding='utf-8').strip()
+                if Path(driver_path).exists():
+                    return driver_path
+        except OSError as e:
+            logger.warning(f"Could not read cached chromedriver path: {e}")
+        
+        return None
+    
+    def install_chromedriver(self):
+        """Resolve chromedriver with webdriver-manager and remember its path for later runs"""
+        driver_path = ChromeDriverManager().install()
+        
+        try:
+            _DRIVER_PATH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            _DRIVER_PATH_CACHE.write_text(driver_path, encoding='utf-8')
+        except OSError as e:
+            logger.warning(f"Could not cache chromedriver path: {e}")
+        
+        return driver_path
+    
+    def block_resources(self):
+        """Block image and font requests through the DevTools protocol"""
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': _BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            logger.warning(f"Could not block resource requests: {e}")
+    
     def extract_price(self, price_text):
         """Extract numeric price from price text"""
         if not price_text:
             return None
         
-        
-        price_clean = re.sub(r'[₹,\s]', '', price_text.strip())
-        
-        
-        numbers = re.findall(r'\d+', price_clean)
-        if numbers:
-            return ''.join(numbers)
+        return _parse_price(price_text)
+
+    def fetch_from_api(self):
+        """Fetch listings from OLX's JSON search API without a browser, one page at a time"""
+        items = []
+        seen_ids = set()
+
+        # As many pages as the browser path loads: the first page plus one per scroll
+        for page in range(_MAX_SCROLLS + 1):
+            try:
+                response = self.http.get(
+                    self.api_url,
+                    params={'query': self.search_query, 'page': page},
+                    headers={'Accept': 'application/json'},
+                    timeout=20
+                )
+                response.raise_for_status()
+                page_items = response.json().get('data') or []
+
+            except Exception as e:
+                logger.warning(f"Listings API request for page {page} failed: {e}")
+                break
+
+            # Stop on an empty page, or one that only repeats items already seen
+            new_items = self.take_new_api_items(page_items, seen_ids)
+            if not new_items:
+                break
+
+            items.extend(new_items)
+            logger.info(f"Fetched listings API page {page} ({len(new_items)} new items)")
+
+        return self.parse_api_items(items)
+
+    def take_new_api_items(self, items, seen_ids):
+        """Return the API items whose id is not in seen_ids, adding their ids to it"""
+        new_items = []
+        for item in items:
+            item_id = item.get('id') if isinstance(item, dict) else None
+            if item_id is not None:
+                if item_id in seen_ids:
+                    continue
+                seen_ids.add(item_id)
+            new_items.append(item)
+        return new_items
+
+    def parse_api_items(self, items):
+        """Convert listings API results into car cover listings"""
+        listings = []
+        for item in items:
+            listing_data = self.parse_api_item(item)
+            if listing_data and self.is_car_cover_listing(listing_data):
+                listings.append(listing_data)
+
+        logger.info(f"Listings API returned {len(items)} items, {len(listings)} car cover listings")
+        return listings
+
+    def parse_api_item(self, item):
+        """Convert a single listings API result into listing data"""
+        try:
+            title = (item.get('title') or '').strip()
+
+            price_value = (item.get('price') or {}).get('value') or {}
+            raw_price = price_value.get('raw')
+            if price_value.get('display'):
+                price = self.extract_price(str(price_value['display']))
+            elif isinstance(raw_price, (int, float)):
+                # A float raw such as 1500.0 would otherwise keep its decimal digit
+                price = str(int(raw_price))
+            else:
+                price = self.extract_price(str(raw_price or ''))
+
+            locations = item.get('locations_resolved') or {}
+            location = ', '.join(
+                name for name in (locations.get('ADMIN_LEVEL_3_name'), locations.get('ADMIN_LEVEL_1_name')) if name
+            )
+
+            item_id = item.get('id')
+            url = 'N/A'
+            if item_id:
+                slug = _SLUG_CHARS.sub('-', title.lower()).strip('-')
+                url = urljoin(self.base_url, f"/item/{slug}-iid-{item_id}")
+
+            return {
+                'title': title or 'N/A',
+                'price': price or 'N/A',
+                'location': sys.intern(location or 'N/A'),
+                'date': sys.intern(str(item.get('display_date') or item.get('created_at') or 'N/A')),
+                'url': url
+            }
+
+        except Exception as e:
+            logger.warning(f"Error parsing API item: {e}")
+            return None
+
+    def fetch_from_html(self):
+        """Fetch the search page over plain HTTP and parse listings from its HTML"""
+        try:
+            response = self.http.get(self.search_url, timeout=20)
+            response.raise_for_status()
+
+        except Exception as e:
+            logger.warning(f"Search page request failed: {e}")
+            return []
+
+        return self.parse_listings_html(response.text)
+
+    def parse_listings_html(self, html):
+        """Parse the document once and extract car cover listings from its item boxes"""
+        soup = BeautifulSoup(html, 'html.parser')
+        listing_elements = soup.select("[data-aut-id='itemBox']")
+
+        listings = []
+        for element in listing_elements:
+            listing_data = self.parse_html_listing(element)
+            if listing_data and self.is_car_cover_listing(listing_data):
+                listings.append(listing_data)
+
+        logger.info(f"HTML contained {len(listing_elements)} items, {len(listings)} car cover listings")
+        return listings
+
+    def parse_html_listing(self, listing_element):
+        """Extract data from a single BeautifulSoup listing element"""
+        try:
+            data = {}
+
+            for field, selectors in _FIELD_SELECTORS.items():
+                value = None
+                for selector in selectors:
+                    elem = listing_element.select_one(selector)
+                    value = elem.get_text(strip=True) if elem else None
+                    if value and field == 'price':
+                        value = self.extract_price(value)
+                    if value:
+                        break
+                value = value or 'N/A'
+                data[field] = sys.intern(value) if field in _INTERNED_FIELDS else value
+
+            link_elem = listing_element.select_one("a[href*='/item/']")
+            data['url'] = urljoin(self.base_url, link_elem['href']) if link_elem else 'N/A'
+
+            return data
+
+        except Exception as e:
+            logger.warning(f"Error parsing HTML listing: {e}")
+            return None
+
+    def read_api_items(self, pending_requests):
+        """Drain the performance log once and return items from finished listings API responses"""
+        try:
+            entries = self.driver.get_log('performance')
+        except Exception as e:
+            logger.warning(f"Performance log unavailable, skipping API capture: {e}")
+            return None
+
+        items = []
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+                method = message.get('method')
+                params = message.get('params') or {}
+
+                if method == 'Network.responseReceived':
+                    if _API_URL_RE.search(params['response']['url']):
+                        pending_requests.add(params['requestId'])
+                    continue
+
+                # The body can only be read once the response has finished loading
+                if method != 'Network.loadingFinished' or params.get('requestId') not in pending_requests:
+                    continue
+                pending_requests.discard(params['requestId'])
+
+                response = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': params['requestId']})
+                body = response['body']
+                if response.get('base64Encoded'):
+                    body = base64.b64decode(body)
+                payload = orjson.loads(body) if orjson is not None else json.loads(body)
+                response_items = payload.get('data') if isinstance(payload, dict) else None
+            except Exception as e:
+                logger.warning(f"Skipping unreadable performance log entry: {e}")
+                continue
+
+            if not isinstance(response_items, list):
+                logger.warning("Captured API response has no listings array, ignoring it")
+                continue
+
+            items.extend(response_items)
+
+        return items
+
+    def capture_api_items(self, pending_requests, timeout=_API_CAPTURE_TIMEOUT):
+        """Wait for the search API response the page itself fetches and return its items"""
+        deadline = time.monotonic() + timeout
+
+        while time.monotonic() < deadline:
+            items = self.read_api_items(pending_requests)
+            if items is None:
+                return None
+            if items:
+                return items
+
+            # Server-rendered pages never issue the XHR, so stop once listings are in the
+            # DOM, after one last read for a response that finished while we checked
+            if self.driver.find_elements(By.CSS_SELECTOR, _ANY_LISTING_SELECTOR):
+                return self.read_api_items(pending_requests) or None
+
+            time.sleep(0.2)
+
+        logger.info("No listings API response observed, falling back to DOM extraction")
         return None
-    
+
+    def present_listing_selector(self, timeout=2):
+        """Return the first listing selector already in the DOM, waiting briefly for any to render"""
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, _ANY_LISTING_SELECTOR))
+            )
+        except TimeoutException:
+            return None
+
+        for selector in _LISTING_SELECTORS:
+            if self.driver.find_elements(By.CSS_SELECTOR, selector):
+                return selector
+        return None
+
     def wait_for_listings(self, timeout=15):
         """Wait for listings to load on the page"""
         try:
-            
-            selectors = [
-                "[data-aut-id='itemBox']",
-                ".EIR5N",  
-                "[data-aut-id='itemTitle']",
-                ".rui-38N2G",
-                ".rui-1ykdW",
-                "li[data-aut-id='itemBox']"
-            ]
-            
-            for selector in selectors:
+            for selector in _LISTING_SELECTORS:
                 try:
                     WebDriverWait(self.driver, timeout).until(
                         EC.presence_of_element_located((By.CSS_SELECTOR, selector))
@@ -91,99 +545,48 @@ class OLXCarCoverScraper:
             logger.error(f"Error waiting for listings: {e}")
             return None
     
+    def find_field(self, listing_element, field, selectors, parse=None):
+        """Find a field value, reusing the selector that first worked for this field"""
+        cached_selector = self._field_selectors.get(field)
+        if cached_selector:
+            elems = listing_element.find_elements(By.CSS_SELECTOR, cached_selector)[:1]
+            if not elems:
+                return None
+            value = elems[0].text.strip()
+            return parse(value) if parse else value
+
+        xpath = _FIELD_XPATHS.get(field)
+        if xpath and not listing_element.find_elements(By.XPATH, xpath):
+            return None
+
+        for selector in selectors:
+            elems = listing_element.find_elements(By.CSS_SELECTOR, selector)[:1]
+            if not elems:
+                continue
+            value = elems[0].text.strip()
+            if parse:
+                value = parse(value)
+            if value:
+                self._field_selectors[field] = selector
+                return value
+
+        return None
+
     def extract_listing_data(self, listing_element):
         """Extract data from a single listing element"""
         try:
             data = {}
             
-            
-            title_selectors = [
-                "[data-aut-id='itemTitle']",
-                "h2", "h3", 
-                ".rui-35953",
-                "a[href*='/item/']"
-            ]
-            
-            title = None
-            for selector in title_selectors:
-                try:
-                    title_elem = listing_element.find_element(By.CSS_SELECTOR, selector)
-                    title = title_elem.text.strip()
-                    if title:
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            data['title'] = title or 'N/A'
-            
-            
-            price_selectors = [
-                "[data-aut-id='itemPrice']",
-                ".rui-ANJaG",
-                "span[class*='price']",
-                "span[class*='amount']"
-            ]
-            
-            price = None
-            for selector in price_selectors:
-                try:
-                    price_elem = listing_element.find_element(By.CSS_SELECTOR, selector)
-                    price_text = price_elem.text.strip()
-                    price = self.extract_price(price_text)
-                    if price:
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            data['price'] = price or 'N/A'
-            
-            
-            location_selectors = [
-                "[data-aut-id='item-location']",
-                ".rui-1Wks1",
-                "span[class*='location']",
-                "span[class*='place']"
-            ]
-            
-            location = None
-            for selector in location_selectors:
-                try:
-                    location_elem = listing_element.find_element(By.CSS_SELECTOR, selector)
-                    location = location_elem.text.strip()
-                    if location:
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            data['location'] = location or 'N/A'
-            
-            date_selectors = [
-                "[data-aut-id='item-date']",
-                "span[class*='date']",
-                "span[class*='time']"
-            ]
-            
-            date = None
-            for selector in date_selectors:
-                try:
-                    date_elem = listing_element.find_element(By.CSS_SELECTOR, selector)
-                    date = date_elem.text.strip()
-                    if date:
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            data['date'] = date or 'N/A'
+            for field, selectors in _FIELD_SELECTORS.items():
+                parse = self.extract_price if field == 'price' else None
+                value = self.find_field(listing_element, field, selectors, parse=parse) or 'N/A'
+                data[field] = sys.intern(value) if field in _INTERNED_FIELDS else value
             
             # Try to get URL
-            url = None
-            try:
-                link_elem = listing_element.find_element(By.CSS_SELECTOR, "a[href*='/item/']")
-                url = link_elem.get_attribute('href')
-            except NoSuchElementException:
-                url = 'N/A'
+            link_elems = listing_element.find_elements(By.CSS_SELECTOR, "a[href*='/item/']")[:1]
+            url = link_elems[0].get_attribute('href') if link_elems else None
             
-            data['url'] = url
+            data['url'] = url or 'N/A'
             
             return data
             
@@ -191,27 +594,137 @@ class OLXCarCoverScraper:
             logger.warning(f"Error extracting listing data: {e}")
             return None
     
-    def scroll_to_load_more(self):
-        """Scroll down to load more listings"""
+    def widen_driver_connection_pool(self, maxsize):
+        """Let the driver's urllib3 pool keep one connection per extraction thread"""
+        # Selenium's RemoteConnection pools a single connection by default, so
+        # concurrent commands would each open and then discard an extra one
         try:
+            pool_manager = self.driver.command_executor._conn
+            pool_manager.connection_pool_kw['maxsize'] = maxsize
+            pool_manager.clear()
+            return True
+        except Exception as e:
+            logger.warning(f"Could not widen WebDriver connection pool, extracting serially: {e}")
+            return False
+    
+    def extract_all_listings(self, listing_selector):
+        """Extract every listing on the page with a single script call"""
+        try:
+            raw_listings = self.driver.execute_script(_EXTRACT_LISTINGS_JS, listing_selector, _FIELD_SELECTORS)
+        except Exception as e:
+            logger.warning(f"Batch extraction failed, falling back to per-element extraction: {e}")
+            return None
+
+        logger.info(f"Found {len(raw_listings or [])} listing elements")
+
+        listings = []
+        for raw in raw_listings or []:
+            listings.append({
+                'title': raw.get('title') or 'N/A',
+                'price': self.extract_price(raw.get('price')) or 'N/A',
+                'location': sys.intern(raw.get('location') or 'N/A'),
+                'date': sys.intern(raw.get('date') or 'N/A'),
+                'url': raw.get('url') or 'N/A'
+            })
+        return listings
+
+    def scroll_to_load_more(self, listing_selector, timeout=5):
+        """Scroll down and wait until more listings are added to the page"""
+        try:
+            count_before = self.driver.execute_script(_SCROLL_AND_WATCH_JS, listing_selector)
             
-            last_height = self.driver.execute_script("return document.body.scrollHeight")
-            
-            
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            
-            time.sleep(3)
-            
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
-            
-            return new_height > last_height
+            try:
+                WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+                    lambda d: d.execute_script(_TAKE_NEW_CONTENT_JS, listing_selector, count_before)
+                )
+                return True
+            except TimeoutException:
+                return False
             
         except Exception as e:
             logger.error(f"Error scrolling: {e}")
             return False
     
-    def scrape_listings(self):
-        """Scrape car cover listings from OLX"""
+    def cache_file(self, run_ts):
+        """Path of the run day's cache file for the current search URL"""
+        url_key = hashlib.sha1(self.search_url.encode('utf-8')).hexdigest()[:16]
+        return self.cache_path / f"{url_key}_{run_ts.strftime('%Y%m%d')}.json"
+
+    def load_cached_listings(self, run_ts):
+        """Return the run day's cached listings for the search URL, or None if there are none"""
+        cache_file = self.cache_file(run_ts)
+        if not cache_file.exists():
+            return None
+
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache file {cache_file}: {e}")
+            return None
+
+        if not isinstance(cached, dict) or cached.get('search_url') != self.search_url:
+            return None
+
+        listings = cached.get('listings')
+        if not isinstance(listings, list) or not all(isinstance(listing, dict) for listing in listings):
+            logger.warning(f"Ignoring malformed cache file {cache_file}")
+            return None
+
+        logger.info(f"Loaded {len(listings)} listings from cache ({cached.get('timestamp')})")
+        return listings
+
+    def save_cached_listings(self, listings, run_ts):
+        """Persist listings so later runs today can skip scraping"""
+        cache_file = self.cache_file(run_ts)
+        # Write beside the target and swap it in, so readers never see a partial file
+        temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_path.mkdir(exist_ok=True)
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'search_url': self.search_url,
+                    'timestamp': run_ts.isoformat(),
+                    'listings': listings
+                }, f, ensure_ascii=False)
+            temp_file.replace(cache_file)
+        except Exception as e:
+            temp_file.unlink(missing_ok=True)
+            logger.warning(f"Could not write cache: {e}")
+
+    def scrape_listings(self, run_ts):
+        """Scrape car cover listings from OLX, reusing today's cached results when available"""
+        if self.use_cache:
+            listings = self.load_cached_listings(run_ts)
+            if listings is not None:
+                return listings
+
+        listings = self.fetch_listings(run_ts)
+
+        if listings and self.use_cache:
+            self.save_cached_listings(listings, run_ts)
+
+        return listings
+
+    def fetch_listings(self, run_ts):
+        """Fetch car cover listings from OLX, using the browser only as a last resort"""
+        listings = self.fetch_from_api()
+        if listings:
+            return listings
+
+        listings = self.fetch_from_html()
+        if listings:
+            return listings
+
+        if not self.use_selenium_fallback:
+            logger.warning("No listings found over HTTP and Selenium fallback is disabled")
+            return []
+
+        logger.info("Falling back to Selenium scraping...")
+        return self.scrape_with_selenium(run_ts)
+
+    def scrape_with_selenium(self, run_ts):
+        """Scrape car cover listings from the rendered OLX page"""
         if not self.setup_driver():
             return []
         
@@ -221,43 +734,64 @@ class OLXCarCoverScraper:
             logger.info(f"Navigating to: {self.search_url}")
             self.driver.get(self.search_url)
             
+            pending_requests = set()
+            api_items = self.capture_api_items(pending_requests)
             
-            time.sleep(5)
-            
-            listing_selector = self.wait_for_listings()
+            if api_items is not None:
+                # Listings came from the API, so they are already rendered or about to be
+                listing_selector = self.present_listing_selector()
+            else:
+                listing_selector = self.wait_for_listings()
             
-            if not listing_selector:
+            if not listing_selector and api_items is None:
                 logger.info("Trying alternative content extraction...")
                 page_source = self.driver.page_source
                 
-                with open(f"page_source_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html", 'w', encoding='utf-8') as f:
+                with open(f"page_source_{run_ts.strftime('%Y%m%d_%H%M%S')}.html", 'w', encoding='utf-8') as f:
                     f.write(page_source)
                 
                 listings = self.extract_from_page_source(page_source)
                 return listings
             
             scroll_attempts = 0
-            max_scrolls = 3
+            max_scrolls = _MAX_SCROLLS
             
-            while scroll_attempts < max_scrolls:
-                if not self.scroll_to_load_more():
+            while listing_selector and scroll_attempts < max_scrolls:
+                if not self.scroll_to_load_more(listing_selector):
                     break
                 scroll_attempts += 1
                 logger.info(f"Scrolled {scroll_attempts}/{max_scrolls} times")
+                
+                # Each load triggered by scrolling is another search API response
+                if api_items is not None:
+                    api_items.extend(self.read_api_items(pending_requests) or [])
             
-            listing_elements = self.driver.find_elements(By.CSS_SELECTOR, listing_selector)
-            logger.info(f"Found {len(listing_elements)} listing elements")
+            if api_items is not None:
+                api_items.extend(self.read_api_items(pending_requests) or [])
+                all_listings = self.parse_api_items(self.take_new_api_items(api_items, set()))
+                logger.info(f"Successfully extracted {len(all_listings)} car cover listings from captured API responses")
+                return all_listings
             
-            for i, element in enumerate(listing_elements):
-                try:
-                    listing_data = self.extract_listing_data(element)
-                    if listing_data and self.is_car_cover_listing(listing_data):
-                        all_listings.append(listing_data)
-                        logger.info(f"Extracted listing {i+1}: {listing_data['title'][:50]}...")
-                        
-                except Exception as e:
-                    logger.warning(f"Error processing listing {i+1}: {e}")
-                    continue
+            listings = self.extract_all_listings(listing_selector)
+
+            if listings is None:
+                listing_elements = self.driver.find_elements(By.CSS_SELECTOR, listing_selector)
+                logger.info(f"Found {len(listing_elements)} listing elements")
+
+                # The first listing probes the selector lists serially; the rest reuse
+                # what worked, overlapping their WebDriver round-trips across threads
+                self._field_selectors = {}
+                listings = [self.extract_listing_data(listing_elements[0])] if listing_elements else []
+                if self.widen_driver_connection_pool(_EXTRACT_WORKERS):
+                    with ThreadPoolExecutor(max_workers=_EXTRACT_WORKERS) as executor:
+                        listings.extend(executor.map(self.extract_listing_data, listing_elements[1:]))
+                else:
+                    listings.extend(self.extract_listing_data(element) for element in listing_elements[1:])
+
+            for i, listing_data in enumerate(listings):
+                if listing_data and self.is_car_cover_listing(listing_data):
+                    all_listings.append(listing_data)
+                    logger.info(f"Extracted listing {i+1}: {listing_data['title'][:50]}...")
             
             logger.info(f"Successfully extracted {len(all_listings)} car cover listings")
             
@@ -272,18 +806,16 @@ class OLXCarCoverScraper:
     
     def extract_from_page_source(self, page_source):
         """Extract listings from page source using regex patterns"""
+        # Only reached once wait_for_listings has ruled out every listing container
+        # selector, so a structured HTML parse would find nothing here
         listings = []
         
         try:
-            price_pattern = r'₹\s*[\d,]+(?:\s*[^<\n]*(?:car\s*cover|seat\s*cover|body\s*cover)[^<\n]*)?'
-            matches = re.finditer(price_pattern, page_source, re.IGNORECASE)
-            
-            for match in matches:
+            for match in _PRICE_CTX.finditer(page_source):
                 context_start = max(0, match.start() - 200)
                 context_end = min(len(page_source), match.end() + 200)
-                context = page_source[context_start:context_end]
                 
-                title_match = re.search(r'(?:car\s*cover|seat\s*cover|body\s*cover|wheel\s*cover)[^<>]*', context, re.IGNORECASE)
+                title_match = _TITLE_CTX.search(page_source, context_start, context_end)
                 if title_match:
                     listing = {
                         'title': title_match.group().strip(),
@@ -301,16 +833,9 @@ class OLXCarCoverScraper:
     
     def is_car_cover_listing(self, listing_data):
         """Check if listing is actually for car covers"""
-        title = listing_data.get('title', '').lower()
+        title = listing_data.get('title', '')
         
-        car_cover_keywords = ['car cover', 'body cover', 'seat cover', 'wheel cover', 'brake cover', 'car mat']
-        
-        exclude_keywords = ['bhk', 'flat', 'apartment', 'parking', 'rent', 'sale', 'sqft', 'bathroom', 'bedroom']
-        
-        has_car_cover = any(keyword in title for keyword in car_cover_keywords)
-        has_property = any(keyword in title for keyword in exclude_keywords)
-        
-        return has_car_cover and not has_property
+        return bool(_INCLUDE_RE.search(title)) and not _EXCLUDE_RE.search(title)
     
     def save_to_csv(self, listings, filename):
         """Save listings to CSV file"""
@@ -320,18 +845,13 @@ class OLXCarCoverScraper:
         
         try:
             with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['title', 'price', 'location', 'date', 'url']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+                writer = csv.writer(csvfile)
                 
-                writer.writeheader()
-                for listing in listings:
-                    writer.writerow({
-                        'title': listing.get('title', 'N/A'),
-                        'price': listing.get('price', 'N/A'),
-                        'location': listing.get('location', 'N/A'),
-                        'date': listing.get('date', 'N/A'),
-                        'url': listing.get('url', 'N/A')
-                    })
+                writer.writerow(_CSV_FIELDS)
+                writer.writerows(
+                    tuple(listing.get(field, 'N/A') for field in _CSV_FIELDS)
+                    for listing in listings
+                )
                     
             logger.info(f"Saved {len(listings)} listings to {filename}")
             return True
@@ -340,7 +860,7 @@ class OLXCarCoverScraper:
             logger.error(f"Error saving to CSV: {e}")
             return False
     
-    def save_to_json(self, listings, filename):
+    def save_to_json(self, listings, filename, run_ts):
         """Save listings to JSON file"""
         if not listings:
             logger.warning("No listings to save")
@@ -348,14 +868,20 @@ class OLXCarCoverScraper:
         
         try:
             data = {
-                'timestamp': datetime.now().isoformat(),
-                'search_query': 'car cover',
+                'timestamp': run_ts.isoformat(),
+                'search_query': self.search_query,
                 'total_listings': len(listings),
                 'listings': listings
             }
             
-            with open(filename, 'w', encoding='utf-8') as jsonfile:
-                json.dump(data, jsonfile, indent=2, ensure_ascii=False)
+            # Both branches write the same compact form; orjson builds the whole
+            # document in memory, json.dump streams it to the file in chunks
+            if orjson is not None:
+                with open(filename, 'wb') as jsonfile:
+                    jsonfile.write(orjson.dumps(data))
+            else:
+                with open(filename, 'w', encoding='utf-8') as jsonfile:
+                    json.dump(data, jsonfile, ensure_ascii=False, separators=(',', ':'))
                 
             logger.info(f"Saved {len(listings)} listings to {filename}")
             return True
@@ -366,22 +892,43 @@ class OLXCarCoverScraper:
 
 def main():
     """Main function"""
+    parser = argparse.ArgumentParser(description="Scrape car cover listings from OLX")
+    parser.add_argument('--no-selenium', action='store_true',
+                        help="Do not fall back to a headless browser when HTTP scraping finds nothing")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Scrape again without reading or writing the daily results cache")
+    parser.add_argument('--debugger-address', metavar='HOST:PORT',
+                        help="Attach to an already running Chrome started with --remote-debugging-port")
+    parser.add_argument('--chromedriver', metavar='PATH',
+                        help="Use this chromedriver binary instead of resolving one with webdriver-manager")
+    args = parser.parse_args()
+
     print("OLX Car Cover Scraper")
     print("=" * 50)
+
+    scraper = OLXCarCoverScraper(
+        use_selenium_fallback=not args.no_selenium,
+        use_cache=not args.no_cache,
+        debugger_address=args.debugger_address,
+        chromedriver_path=args.chromedriver
+    )
     
-    scraper = OLXCarCoverScraper()
+    # Shared by every file this run writes so their timestamps agree
+    run_ts = datetime.now()
+    timestamp = run_ts.strftime("%Y%m%d_%H%M%S")
     
     print("Starting scraping process...")
-    listings = scraper.scrape_listings()
+    try:
+        listings = scraper.scrape_listings(run_ts)
+    finally:
+        scraper.close()
     
     if listings:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
         csv_filename = f"olx_car_covers_{timestamp}.csv"
         json_filename = f"olx_car_covers_{timestamp}.json"
         
         csv_saved = scraper.save_to_csv(listings, csv_filename)
-        json_saved = scraper.save_to_json(listings, json_filename)
+        json_saved = scraper.save_to_json(listings, json_filename, run_ts)
         
         print(f"\nScraping completed successfully!")
         print(f"Found {len(listings)} car cover listings")